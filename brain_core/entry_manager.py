@@ -6,6 +6,25 @@ from pathlib import Path
 
 from .constants import MIN_SUBSTANTIAL_CONTENT_CHARS
 
+# Section and link patterns, compiled once at import
+_REFLECTION_PROMPTS_RE = re.compile(r"## Reflection Prompts\n(.*?)(?=\n---|\n##|$)", re.DOTALL)
+_BRAIN_DUMP_RE = re.compile(r"## Brain Dump\n(.*?)(?=\n---|\n##|$)", re.DOTALL)
+_MEMORY_LINKS_RE = re.compile(r"## Memory Links\n(.*?)$", re.DOTALL)
+_MEMORY_LINKS_SECTION_RE = re.compile(r"## Memory Links\n.*$", re.DOTALL)
+_BACKLINK_RE = re.compile(r"\[\[([^\]]+)\]\]")
+_TAG_RE = re.compile(r"#(\w+)")
+
+# Todo patterns for extract_todos
+_TODO_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE | re.MULTILINE)
+    for pattern in (
+        r"(?:^|\n)[-*•]\s*(?:TODO|To do|Action):\s*(.+?)(?:\n|$)",  # - TODO: item
+        r"(?:^|\n)[-*•]\s*\[ \]\s*(.+?)(?:\n|$)",  # - [ ] item (checkbox)
+        r"(?:^|\n)(?:TODO|To do|Action):\s*(.+?)(?:\n|$)",  # TODO: item
+        r"(?:^|\n)(?:I need to|I should|I must|I will)\s+(.+?)(?:\.|$)",  # Natural language
+    )
+]
+
 
 class DiaryEntry:
     """Represents a single diary entry."""
@@ -17,6 +36,7 @@ class DiaryEntry:
         self._reflection_prompts: str | None = None
         self._brain_dump: str | None = None
         self._memory_links: str | None = None
+        self._sections_parsed = False
 
     @property
     def filename(self) -> str:
@@ -28,43 +48,44 @@ class DiaryEntry:
     def parse_sections(self) -> None:
         """Parse content into sections."""
         # Extract Reflection Prompts section
-        reflection_match = re.search(
-            r"## Reflection Prompts\n(.*?)(?=\n---|\n##|$)", self.content, re.DOTALL
-        )
+        reflection_match = _REFLECTION_PROMPTS_RE.search(self.content)
         if reflection_match:
             self._reflection_prompts = reflection_match.group(1).strip()
 
         # Extract Brain Dump section
-        brain_dump_match = re.search(
-            r"## Brain Dump\n(.*?)(?=\n---|\n##|$)", self.content, re.DOTALL
-        )
+        brain_dump_match = _BRAIN_DUMP_RE.search(self.content)
         if brain_dump_match:
             self._brain_dump = brain_dump_match.group(1).strip()
 
         # Extract Memory Links section
-        memory_links_match = re.search(r"## Memory Links\n(.*?)$", self.content, re.DOTALL)
+        memory_links_match = _MEMORY_LINKS_RE.search(self.content)
         if memory_links_match:
             self._memory_links = memory_links_match.group(1).strip()
 
+        self._sections_parsed = True
+
     @property
     def brain_dump(self) -> str:
         """Get brain dump content."""
-        if self._brain_dump is None:
+        if not self._sections_parsed:
             self.parse_sections()
         return self._brain_dump or ""
 
     @property
     def has_substantial_content(self) -> bool:
         """Check if entry has substantial content in brain dump."""
+        # No Brain Dump header means no brain dump, so skip section parsing
+        if "## Brain Dump" not in self.content:
+            return False
         return len(self.brain_dump) > MIN_SUBSTANTIAL_CONTENT_CHARS
 
     def get_backlinks(self) -> list[str]:
         """Extract all [[backlinks]] from content."""
-        return re.findall(r"\[\[([^\]]+)\]\]", self.content)
+        return _BACKLINK_RE.findall(self.content)
 
     def get_tags(self) -> list[str]:
         """Extract all #tags from content."""
-        return re.findall(r"#(\w+)", self.content)
+        return _TAG_RE.findall(self.content)
 
 
 class EntryManager:
@@ -243,9 +264,7 @@ class EntryManager:
         # Replace or append Memory Links section
         if "## Memory Links" in entry.content:
             # Replace existing section
-            new_content = re.sub(
-                r"## Memory Links\n.*$", new_memory_section, entry.content, flags=re.DOTALL
-            )
+            new_content = _MEMORY_LINKS_SECTION_RE.sub(new_memory_section, entry.content)
         else:
             # Append new section
             new_content = entry.content.rstrip() + "\n\n" + new_memory_section
@@ -265,18 +284,11 @@ def extract_todos(entry: DiaryEntry) -> list[str]:
     """
     todos = []
 
-    # Look for common todo patterns
-    patterns = [
-        r"(?:^|\n)[-*•]\s*(?:TODO|To do|Action):\s*(.+?)(?:\n|$)",  # - TODO: item
-        r"(?:^|\n)[-*•]\s*\[ \]\s*(.+?)(?:\n|$)",  # - [ ] item (checkbox)
-        r"(?:^|\n)(?:TODO|To do|Action):\s*(.+?)(?:\n|$)",  # TODO: item
-        r"(?:^|\n)(?:I need to|I should|I must|I will)\s+(.+?)(?:\.|$)",  # Natural language
-    ]
-
     content = entry.content
 
-    for pattern in patterns:
-        matches = re.finditer(pattern, content, re.IGNORECASE | re.MULTILINE)
+    # Look for common todo patterns
+    for pattern in _TODO_PATTERNS:
+        matches = pattern.finditer(content)
         for match in matches:
             todo = match.group(1).strip()
             if todo and len(todo) > 3:  # Filter out very short matches
@@ -1,17 +1,40 @@
 """Shared test fixtures."""
 
 from datetime import date
-from pathlib import Path
-from tempfile import TemporaryDirectory
 
 import pytest
 
+# Azure OpenAI configuration (required)
+AZURE_OPENAI_TEST_ENV = {
+    "AZURE_OPENAI_API_KEY": "test-openai-key",
+    "AZURE_OPENAI_ENDPOINT": "https://test.openai.azure.com/",
+    "AZURE_OPENAI_DEPLOYMENT": "gpt-4",
+    "AZURE_OPENAI_API_VERSION": "2024-02-15-preview",
+}
+
+# Backs the sample_entry_content fixture; request the fixture, don't import conftest
+SAMPLE_ENTRY_CONTENT = """## Reflection Prompts
+**1. What did you learn today?**
+**2. What are you grateful for?**
+
+---
+
+## Brain Dump
+Today I focused on deep work and made great progress on the project.
+I learned about semantic search and reflective journaling.
+
+---
+
+## Memory Links
+**Temporal:** [[2025-10-11]] • [[2025-10-10]]
+**Topics:** #productivity #learning
+"""
+
 
 @pytest.fixture
-def temp_dir():
-    """Create a temporary directory for tests."""
-    with TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+def temp_dir(tmp_path):
+    """Create a temporary directory for tests (backed by pytest's tmp_path)."""
+    return tmp_path
 
 
 @pytest.fixture
@@ -25,11 +48,8 @@ def mock_env(monkeypatch, temp_dir):
     monkeypatch.setenv("DIARY_PATH", str(diary_path))
     monkeypatch.setenv("PLANNER_PATH", str(planner_path))
 
-    # Azure OpenAI configuration (required)
-    monkeypatch.setenv("AZURE_OPENAI_API_KEY", "test-openai-key")
-    monkeypatch.setenv("AZURE_OPENAI_ENDPOINT", "https://test.openai.azure.com/")
-    monkeypatch.setenv("AZURE_OPENAI_DEPLOYMENT", "gpt-4")
-    monkeypatch.setenv("AZURE_OPENAI_API_VERSION", "2024-02-15-preview")
+    for key, value in AZURE_OPENAI_TEST_ENV.items():
+        monkeypatch.setenv(key, value)
 
     return {
         "diary_path": diary_path,
@@ -37,28 +57,13 @@ def mock_env(monkeypatch, temp_dir):
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_entry_content():
     """Sample diary entry content."""
-    return """## Reflection Prompts
-**1. What did you learn today?**
-**2. What are you grateful for?**
+    return SAMPLE_ENTRY_CONTENT
 
----
 
-## Brain Dump
-Today I focused on deep work and made great progress on the project.
-I learned about semantic search and reflective journaling.
-
----
-
-## Memory Links
-**Temporal:** [[2025-10-11]] • [[2025-10-10]]
-**Topics:** #productivity #learning
-"""
-
-
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_date():
     """Sample date for testing."""
     return date(2025, 10, 12)